@@ -1,282 +1,689 @@
 import sys
 import os
+import copy
+import ctypes
+import hashlib
+import random
+import re
+import shutil
+import threading
+import time
+import psutil
 import yt_dlp
 import json
+from pathlib import Path
+from urllib.parse import urlparse
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtWidgets import (QFileDialog, QProgressBar, QComboBox, 
                              QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, 
-                             QPushButton, QTextEdit, QCheckBox, QGroupBox,
-                             QMessageBox, QSplitter)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
-from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+                             QPushButton, QPlainTextEdit, QCheckBox, QGroupBox,
+                             QMessageBox, QSplitter, QSpinBox)
+from PyQt5.QtCore import Qt, QTimer, QThread, QObject, QRunnable, pyqtSignal, pyqtSlot
+from PyQt5.QtNetwork import (QNetworkAccessManager, QNetworkRequest, QNetworkReply,
+                             QNetworkDiskCache)
 
+# Video id in YouTube watch/short/shorts links, used to build thumbnail URLs
+_YT_ID_RE = re.compile(r"(?:v=|youtu\.be/|shorts/)([A-Za-z0-9_-]{11})")
+# Whole-percent part of yt-dlp's _percent_str, which may carry colour codes
+_PERCENT_RE = re.compile(r"(\d+)(?:\.\d*)?%")
+# View-count suffix and divisor, indexed by the number of digit groups past the first
+_VIEW_UNITS = (('', 1), ('K', 1_000), ('M', 1_000_000), ('B', 1_000_000_000))
 
-class DownloadThread(QThread):
-    progress_signal = pyqtSignal(int)
-    status_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal(str)
-    error_signal = pyqtSignal(str)
-    log_signal = pyqtSignal(str)
+# oEmbed endpoints for sites that publish one, keyed by host
+_OEMBED_ENDPOINTS = {
+    'vimeo.com': 'https://vimeo.com/api/oembed.json',
+    'dailymotion.com': 'https://www.dailymotion.com/services/oembed',
+    'soundcloud.com': 'https://soundcloud.com/oembed',
+    'tiktok.com': 'https://www.tiktok.com/oembed',
+}
 
-    def __init__(self, url, path, format_choice='best', audio_only=False, parent=None):
-        super().__init__(parent)
+
+def _oembed_endpoint(url):
+    host = urlparse(url).hostname or ''
+    for domain, endpoint in _OEMBED_ENDPOINTS.items():
+        if host == domain or host.endswith('.' + domain):
+            return endpoint
+    return None
+
+
+USER_AGENT = b'Mozilla/5.0 (compatible; PhinixDownloader)'
+
+
+def _network_request(url):
+    # HTTP/2 lets consecutive requests to the same CDN share one connection;
+    # hosts that only speak HTTP/1.1 can still pipeline on a kept-alive one
+    request = QNetworkRequest(url)
+    request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+    request.setAttribute(QNetworkRequest.HttpPipeliningAllowedAttribute, True)
+    request.setRawHeader(b'User-Agent', USER_AGENT)
+    return request
+
+
+def _info_thumbnail(info):
+    # Unprocessed extractor results often only carry the thumbnails list
+    return info.get('thumbnail') or (info.get('thumbnails') or [{}])[-1].get('url')
+
+
+# Per-user cache folder in the platform's usual place (~/.cache, %LOCALAPPDATA%, ~/Library/Caches)
+CACHE_DIR = Path(QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.GenericCacheLocation)) / "phinix"
+# Downloaded thumbnails are kept here so revisiting a video skips the network
+THUMBNAIL_CACHE_DIR = CACHE_DIR / "thumb"
+THUMBNAIL_CACHE_FILES = 500
+# HTTP cache for the network manager, so repeat requests can be answered locally
+NETWORK_CACHE_DIR = CACHE_DIR / "net"
+NETWORK_CACHE_SIZE = 64 * 1024 * 1024
+# tmpfs mount used for short-lived intermediate files, where the OS has one
+RAM_TEMP_ROOT = '/dev/shm'
+# QPixmapCache budget in KiB for decoded thumbnails (Qt's default is 10 MiB)
+PIXMAP_CACHE_KB = 20480
+# Downloads running at the same time; the rest of a batch waits its turn
+MAX_CONCURRENT_DOWNLOADS = 4
+# Looked-up video info kept per URL. YouTube's signed format URLs expire
+# after about 6 hours, so entries are looked up again well before that.
+INFO_CACHE_TTL = 2 * 60 * 60
+INFO_CACHE_SIZE = 100
+# Lines kept in the log panel; the oldest are dropped first
+LOG_MAX_LINES = 5000
+# Options for the shared metadata-only YoutubeDL
+INFO_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'extract_flat': 'in_playlist',
+    # Manifests stay in: downloads reuse this info as their format list.
+    # Subtitles are never shown or downloaded.
+    'extractor_args': {'youtube': {'skip': ['translated_subs']}},
+}
+# Parallel HLS/DASH fragments, or aria2c connections per file; servers
+# tend to throttle past 16
+DEFAULT_FRAGMENT_DOWNLOADS = min((os.cpu_count() or 1) * 2, 16)
+
+
+# Dark theme for the main window
+APP_STYLESHEET = """
+    QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 11px;
+    }
+    QLineEdit {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        padding: 8px;
+        font-size: 12px;
+    }
+    QLineEdit:focus {
+        border-color: #00ff88;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #00ff88;
+        color: #000000;
+    }
+    QPushButton:pressed {
+        background-color: #00cc6a;
+    }
+    QPushButton:disabled {
+        background-color: #555555;
+        color: #888888;
+    }
+    QComboBox {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        padding: 8px;
+        font-size: 12px;
+    }
+    QComboBox:hover {
+        border-color: #00ff88;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-style: solid;
+        border-width: 3px;
+        border-color: #ffffff transparent transparent transparent;
+    }
+    QSpinBox {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        padding: 6px;
+        font-size: 12px;
+    }
+    QSpinBox:hover {
+        border-color: #00ff88;
+    }
+    QProgressBar {
+        border: 2px solid #404040;
+        border-radius: 8px;
+        text-align: center;
+        font-weight: bold;
+    }
+    QProgressBar::chunk {
+        background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                          stop:0 #00ff88, stop:1 #00cc6a);
+        border-radius: 6px;
+    }
+    QPlainTextEdit {
+        background-color: #2d2d2d;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        padding: 8px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 10px;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 10px 0 10px;
+    }
+    QCheckBox {
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #404040;
+        border-radius: 4px;
+        background-color: #2d2d2d;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #00ff88;
+        border-color: #00ff88;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+"""
+
+THUMBNAIL_STYLESHEET = """
+    border: 2px solid #555;
+    border-radius: 8px;
+    background-color: #2c2c2c;
+    color: #888;
+"""
+
+
+def _thumbnail_cache_path(url):
+    key = hashlib.blake2s(url.encode(), digest_size=8).hexdigest()
+    return THUMBNAIL_CACHE_DIR / f"{key}.jpg"
+
+
+def _prune_thumbnail_cache():
+    # Keep the most recently written thumbnails, drop the rest
+    try:
+        with os.scandir(THUMBNAIL_CACHE_DIR) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it if e.is_file()]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[THUMBNAIL_CACHE_FILES:]:
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _preallocate(path, size):
+    # Reserve disk space for the whole download so the filesystem can hand
+    # out contiguous extents. The file length must not change: yt-dlp
+    # appends to the .part file and resumes from its size.
+    try:
+        with open(path, 'r+b') as f:
+            if sys.platform.startswith('linux'):
+                libc = ctypes.CDLL(None, use_errno=True)
+                libc.fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong]
+                libc.fallocate(f.fileno(), 1, 0, size)  # 1 = FALLOC_FL_KEEP_SIZE
+            elif sys.platform == 'win32':
+                import msvcrt
+                allocation = ctypes.c_longlong(size)  # FILE_ALLOCATION_INFO
+                ctypes.windll.kernel32.SetFileInformationByHandle(
+                    msvcrt.get_osfhandle(f.fileno()), 5,  # 5 = FileAllocationInfo
+                    ctypes.byref(allocation), ctypes.sizeof(allocation))
+    except (OSError, AttributeError):
+        pass
+
+
+# The DownloadJob running on each pool thread, so the helper processes it
+# starts can be told apart from those of other downloads
+_current_job = threading.local()
+
+
+def _track_helper_processes():
+    # yt-dlp starts ffmpeg and aria2c through its own Popen class; record
+    # each process on the job whose thread started it
+    popen_init = yt_dlp.utils.Popen.__init__
+
+    def __init__(self, *args, **kwargs):
+        popen_init(self, *args, **kwargs)
+        job = getattr(_current_job, 'job', None)
+        if job is not None:
+            job.add_helper(self.pid)
+
+    yt_dlp.utils.Popen.__init__ = __init__
+
+
+_track_helper_processes()
+
+
+def _read_thumbnail(reader):
+    # Ask the decoder for the preview size directly; JPEG can downscale
+    # while decoding instead of producing a full-size image to shrink
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(300, 170, Qt.KeepAspectRatio))
+    image = reader.read()
+    
+    # Only formats that cannot report their size arrive unscaled; a plain
+    # sample is enough for a preview this small
+    if image.width() > 300 or image.height() > 170:
+        image = image.scaled(300, 170, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image
+
+
+class DownloadSignals(QObject):
+    # Shared by every DownloadJob; per-job signals carry the job itself
+    progress = pyqtSignal(object, int)
+    status = pyqtSignal(str)
+    finished = pyqtSignal(object, str)
+    error = pyqtSignal(object, str)
+    log = pyqtSignal(str)
+    done = pyqtSignal(object)
+
+
+class DownloadJob(QRunnable):
+    # yt-dlp can call the hook thousands of times a second; the GUI only
+    # needs a handful of updates per second
+    PROGRESS_INTERVAL = 0.1
+    LOG_INTERVAL = 1.0
+    # Unit and power-of-two shift, indexed by bit_length() // 10
+    SPEED_UNITS = (('B/s', 0), ('KB/s', 10), ('MB/s', 20), ('GB/s', 30))
+    # Weight of the newest sample in the displayed speed's moving average
+    SPEED_SMOOTHING = 0.2
+    
+    _FORMAT_MAP = {
+        'Best Quality': 'bestvideo+bestaudio/best',
+        '1080p': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
+        '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]',
+        '480p': 'bestvideo[height<=480]+bestaudio/best[height<=480]',
+        '360p': 'bestvideo[height<=360]+bestaudio/best[height<=360]'
+    }
+    # Relative to paths['home']; yt-dlp adds the directory itself
+    _OUTTMPL = '%(title)s.%(ext)s'
+    # yt-dlp copies each postprocessor definition, so one list can be shared
+    _AUDIO_POST = [{
+        'key': 'FFmpegExtractAudio',
+        'preferredcodec': 'mp3',
+        'preferredquality': '192',
+    }]
+
+    def __init__(self, signals, url, path, format_choice='best', audio_only=False, info=None,
+                 fragment_downloads=DEFAULT_FRAGMENT_DOWNLOADS, container='mkv', retries=10,
+                 retry_delay=1, ffmpeg_path=None, aria2_path=None):
+        super().__init__()
+        self.signals = signals
         self.url = url
-        self.path = path
+        self.path = os.fspath(path)
         self.format_choice = format_choice
         self.audio_only = audio_only
-        self.is_cancelled = False
+        self.info = info
+        self.fragment_downloads = fragment_downloads
+        self.container = container
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.ffmpeg_path = ffmpeg_path
+        self.aria2_path = aria2_path
+        self._cancelled = threading.Event()
+        self._helper_pids = []
+        self._last_emit = 0.0
+        self._last_log = 0.0
+        self._last_percent = -1
+        self._preallocated = set()
+        self._speed_ema = None
+        
+        # Output locations are fixed for the job's lifetime, so settle them once
+        self._paths = {'home': self.path}
+        # The source audio is thrown away after conversion, so keep it in RAM
+        # rather than writing and deleting it on disk. Video parts are too big.
+        if audio_only and os.access(RAM_TEMP_ROOT, os.W_OK):
+            self._paths['temp'] = os.path.join(RAM_TEMP_ROOT, 'phinix')
 
     def run(self):
         def hook(d):
-            if self.is_cancelled:
-                return
+            # Unwinds through yt-dlp, which closes its sockets and files
+            if self._cancelled.is_set():
+                raise yt_dlp.utils.DownloadCancelled()
                 
             if d['status'] == 'downloading':
+                # Once per file, as soon as its size is known
+                tmpfilename = d.get('tmpfilename')
+                if tmpfilename and d.get('total_bytes') and tmpfilename not in self._preallocated:
+                    self._preallocated.add(tmpfilename)
+                    _preallocate(tmpfilename, d['total_bytes'])
+                
+                now = time.monotonic()
+                if now - self._last_emit < self.PROGRESS_INTERVAL:
+                    return
+                self._last_emit = now
+                
                 percent = 0
-                if 'total_bytes' in d and d['total_bytes']:
-                    downloaded_bytes = d.get('downloaded_bytes', 0)
-                    total_bytes = d['total_bytes']
-                    if total_bytes > 0:
-                        percent = int((downloaded_bytes / total_bytes) * 100)
+                total_bytes = d.get('total_bytes')
+                if total_bytes and total_bytes > 0:
+                    percent = (d.get('downloaded_bytes') or 0) * 100 // total_bytes
                 elif '_percent_str' in d:
-                    percent_str = d['_percent_str'].strip().replace('%', '')
-                    try:
-                        percent = int(float(percent_str))
-                    except ValueError:
-                        percent = 0
+                    match = _PERCENT_RE.search(d['_percent_str'])
+                    if match:
+                        percent = int(match.group(1))
 
-                self.progress_signal.emit(percent)
+                if percent != self._last_percent:
+                    self._last_percent = percent
+                    self.signals.progress.emit(self, percent)
 
                 status_text = "🚀 Downloading..."
                 if 'speed' in d and d['speed'] is not None:
+                    # yt-dlp's per-chunk speed jumps around; show a moving average
                     speed = d['speed']
-                    unit = 'B/s'
-                    if speed > 1024 * 1024:
-                        speed /= (1024 * 1024)
-                        unit = 'MB/s'
-                    elif speed > 1024:
-                        speed /= 1024
-                        unit = 'KB/s'
-                    status_text += f" Speed: {speed:.2f} {unit}"
+                    if self._speed_ema is not None:
+                        speed = self._speed_ema + self.SPEED_SMOOTHING * (speed - self._speed_ema)
+                    self._speed_ema = speed
+                    index = min(max(0, (int(speed).bit_length() - 1) // 10), 3)
+                    unit, shift = self.SPEED_UNITS[index]
+                    status_text += f" Speed: {speed / (1 << shift):.2f} {unit}"
                 
                 if 'eta' in d and d['eta'] is not None:
                     eta = d['eta']
                     minutes, seconds = divmod(eta, 60)
                     status_text += f" | ETA: {int(minutes):02d}:{int(seconds):02d}"
                 
-                self.status_signal.emit(status_text)
-                self.log_signal.emit(f"Progress: {percent}% - {status_text}")
+                self.signals.status.emit(status_text)
+                # The log only needs a line a second; the status label has the rest
+                if now - self._last_log >= self.LOG_INTERVAL:
+                    self._last_log = now
+                    self.signals.log.emit(f"Progress: {percent}% - {status_text}")
 
             elif d['status'] == 'finished':
-                self.progress_signal.emit(100)
-                self.status_signal.emit("✅ Download completed!")
-                if 'filename' in d and os.path.exists(d['filename']):
-                    self.finished_signal.emit(d['filename'])
-                    self.log_signal.emit(f"✅ Download completed: {d['filename']}")
+                self._last_percent = 100
+                self._speed_ema = None
+                self.signals.progress.emit(self, 100)
+                self.signals.status.emit("✅ Download completed!")
+
+        def postprocessor_hook(d):
+            # MoveFiles always runs last and knows where the final file ended up,
+            # after any merge, audio extraction or move out of the temp dir
+            if self._cancelled.is_set():
+                raise yt_dlp.utils.DownloadCancelled()
+            if d['status'] == 'finished' and d['postprocessor'] == 'MoveFiles':
+                filepath = d['info_dict']['filepath']
+                self.signals.finished.emit(self, filepath)
+                self.signals.log.emit(f"✅ Download completed: {filepath}")
 
         # Set up download options
         if self.audio_only:
             format_selector = 'bestaudio/best'
-            output_ext = 'mp3'
         else:
-            format_map = {
-                'Best Quality': 'bestvideo+bestaudio/best',
-                '1080p': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
-                '720p': 'bestvideo[height<=720]+bestaudio/best[height<=720]',
-                '480p': 'bestvideo[height<=480]+bestaudio/best[height<=480]',
-                '360p': 'bestvideo[height<=360]+bestaudio/best[height<=360]'
-            }
-            format_selector = format_map.get(self.format_choice, 'best')
-            output_ext = 'mp4'
+            format_selector = self._FORMAT_MAP.get(self.format_choice, 'best')
 
         ydl_opts = {
             'format': format_selector,
-            'outtmpl': os.path.join(self.path, '%(title)s.%(ext)s'),
+            'outtmpl': self._OUTTMPL,
+            'paths': self._paths,
             'progress_hooks': [hook],
-            'merge_output_format': output_ext,
+            'postprocessor_hooks': [postprocessor_hook],
             'writeinfojson': False,
             'writethumbnail': False,
             'ignoreerrors': False,
+            # Fetch segmented formats several fragments at a time
+            'concurrent_fragment_downloads': self.fragment_downloads,
+            'http_chunk_size': 10 << 20,
+            'buffersize': 1 << 16,
+            # Ride out network blips instead of failing the whole download;
+            # waits grow exponentially (with jitter for HTTP) up to 30 s
+            'retries': self.retries,
+            'fragment_retries': self.retries,
+            'extractor_retries': 3,
+            'retry_sleep_functions': {
+                'http': lambda n: min(30, self.retry_delay * 2 ** n + random.random()),
+                'fragment': lambda n: min(30, self.retry_delay * 2 ** n),
+            },
+            'socket_timeout': 20,
+            'continuedl': True,
+            # Subtitles are never downloaded, and playlist pages are walked as
+            # they download rather than resolved up front. Manifests stay on:
+            # live streams have no other formats.
+            'extractor_args': {'youtube': {'skip': ['translated_subs']}},
+            'lazy_playlist': True,
         }
 
+        # Only a video+audio pair needs muxing into the chosen container
+        if '+' in format_selector:
+            ydl_opts['merge_output_format'] = self.container
+
         # Add audio extraction options if audio only
         if self.audio_only:
-            ydl_opts['postprocessors'] = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }]
+            ydl_opts['postprocessors'] = self._AUDIO_POST
+            ydl_opts['postprocessor_args'] = {'extractaudio+ffmpeg': ['-threads', '0']}
+
+        # Point yt-dlp at the ffmpeg found at startup instead of letting it search
+        if self.ffmpeg_path is not None:
+            ydl_opts['ffmpeg_location'] = self.ffmpeg_path
+
+        # Fetch plain HTTP formats over several ranged connections when aria2c
+        # is available, using the same parallelism as for fragments
+        if self.aria2_path is not None:
+            connections = str(self.fragment_downloads)
+            ydl_opts['external_downloader'] = {'http': self.aria2_path}
+            ydl_opts['external_downloader_args'] = {
+                'aria2c': ['-x', connections, '-s', connections, '-k', '1M', '--file-allocation=falloc'],
+            }
 
         try:
-            self.log_signal.emit(f"Starting download from: {self.url}")
-            self.log_signal.emit(f"Format: {format_selector}")
-            self.log_signal.emit(f"Output path: {self.path}")
+            # Cancelled while still queued; returning still reports done
+            if self._cancelled.is_set():
+                return
+            _current_job.job = self
+            self.signals.log.emit(f"Starting download from: {self.url}")
+            self.signals.log.emit(f"Format: {format_selector}")
+            self.signals.log.emit(f"Output path: {self.path}")
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([self.url])
+                if self.info is not None:
+                    # Reuse the metadata VideoInfoJob already extracted
+                    try:
+                        ydl.process_ie_result(self.info, download=True)
+                    except yt_dlp.utils.DownloadError as e:
+                        # The signed format URLs in cached info can expire or be
+                        # refused; extract afresh once rather than fail outright
+                        if self._cancelled.is_set() or 'HTTP Error' not in str(e):
+                            raise
+                        self.signals.log.emit(f"🔄 Cached info was refused, extracting again: {self.url}")
+                        ydl.download([self.url])
+                else:
+                    ydl.download([self.url])
                 
+        except yt_dlp.utils.DownloadCancelled:
+            self.signals.log.emit(f"⏹ Download stopped: {self.url}")
         except yt_dlp.utils.DownloadError as e:
-            error_msg = f"Download Error: {str(e)}"
-            self.error_signal.emit(error_msg)
-            self.log_signal.emit(f"❌ {error_msg}")
+            self._report_error(f"Download Error: {str(e)}")
         except Exception as e:
-            error_msg = f"Unexpected Error: {str(e)}"
-            self.error_signal.emit(error_msg)
-            self.log_signal.emit(f"❌ {error_msg}")
+            self._report_error(f"Unexpected Error: {str(e)}")
+        finally:
+            _current_job.job = None
+            self.signals.done.emit(self)
+
+    def _report_error(self, error_msg):
+        # A helper stopped on cancel makes yt-dlp fail rather than unwind
+        if self._cancelled.is_set():
+            self.signals.log.emit(f"⏹ Download stopped: {self.url}")
+            return
+        self.signals.error.emit(self, error_msg)
+        self.signals.log.emit(f"❌ {error_msg}")
+
+    def add_helper(self, pid):
+        self._helper_pids.append(pid)
+        # Started between a cancel and the next hook
+        if self._cancelled.is_set():
+            self._stop_helpers()
+
+    def _stop_helpers(self):
+        # ffmpeg and aria2c never see yt-dlp's cancellation, so stop the ones
+        # this job started along with anything they spawned. Only processes
+        # still among our children match, so a reused PID is left alone.
+        try:
+            children = {p.pid: p for p in psutil.Process().children(recursive=True)}
+        except psutil.Error:
+            return
+        for pid in list(self._helper_pids):
+            process = children.get(pid)
+            if process is None:
+                continue
+            try:
+                for child in process.children(recursive=True):
+                    child.kill()
+                process.kill()
+            except psutil.Error:
+                pass
 
     def cancel(self):
-        self.is_cancelled = True
-        self.terminate()
+        # The hooks raise DownloadCancelled at yt-dlp's next progress report
+        self._cancelled.set()
+        self._stop_helpers()
 
 
-class VideoInfoThread(QThread):
-    info_signal = pyqtSignal(dict)
-    error_signal = pyqtSignal(str)
+class InfoSignals(QObject):
+    info = pyqtSignal(str, dict)
+    error = pyqtSignal(str)
 
-    def __init__(self, url, parent=None):
-        super().__init__(parent)
+
+class VideoInfoJob(QRunnable):
+    def __init__(self, signals, url, ydl, ydl_lock):
+        super().__init__()
+        self.signals = signals
         self.url = url
+        self.ydl = ydl
+        self.ydl_lock = ydl_lock
+        self._cancelled = threading.Event()
 
     def run(self):
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-            }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url, download=False)
-                self.info_signal.emit(info)
+            # The YoutubeDL is shared between lookups and is not thread-safe
+            with self.ydl_lock:
+                # A newer lookup replaced this one while it waited for the lock
+                if self._cancelled.is_set():
+                    return
+                # Only run the extractor; format selection happens at download time
+                info = self.ydl.extract_info(self.url, download=False, process=False)
+            # Plain JSON-like data crosses the signal and deep-copies cleanly
+            self.signals.info.emit(self.url, self.ydl.sanitize_info(info))
         except Exception as e:
-            self.error_signal.emit(str(e))
+            self.signals.error.emit(str(e))
+
+    def cancel(self):
+        self._cancelled.set()
+
+
+class ThumbnailWorker(QObject):
+    done = pyqtSignal(str, QtGui.QImage)
+
+    @pyqtSlot(str, QtCore.QByteArray)
+    def load(self, url, data):
+        # An empty payload means the thumbnail is already in the disk cache
+        if data.isEmpty():
+            image = _read_thumbnail(QtGui.QImageReader(str(_thumbnail_cache_path(url))))
+        else:
+            buffer = QtCore.QBuffer(data)
+            buffer.open(QtCore.QIODevice.ReadOnly)
+            image = _read_thumbnail(QtGui.QImageReader(buffer))
+            if not image.isNull():
+                try:
+                    THUMBNAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    _thumbnail_cache_path(url).write_bytes(bytes(data))
+                except OSError:
+                    pass
+        
+        self.done.emit(url, image)
 
 
 class VideoDownloaderApp(QtWidgets.QWidget):
+    thumbnail_job = pyqtSignal(str, QtCore.QByteArray)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("⚡ Advanced Video Downloader")
         self.setGeometry(100, 100, 1000, 700)
-        self.setStyleSheet(self.get_app_stylesheet())
+        self.setStyleSheet(APP_STYLESHEET)
         
         # Initialize variables
         self.selected_path = os.path.expanduser("~/Downloads")
-        self.download_thread = None
-        self.info_thread = None
+        # Helper binaries don't come and go while the app runs; look them up once
+        self.ffmpeg_path = shutil.which('ffmpeg')
+        self.aria2_path = shutil.which('aria2c')
+        self.download_jobs = []
+        self.active_downloads = 0
+        self.info_job = None
+        self.close_timer = None
         self.thumbnail_label = QLabel(self)
         self.network_manager = QNetworkAccessManager()
+        network_cache = QNetworkDiskCache(self)
+        network_cache.setCacheDirectory(str(NETWORK_CACHE_DIR))
+        network_cache.setMaximumCacheSize(NETWORK_CACHE_SIZE)
+        self.network_manager.setCache(network_cache)
+        self.network_manager.setTransferTimeout(5000)
+        # Open the TLS session to YouTube's thumbnail CDN before the first paste
+        self.network_manager.connectToHostEncrypted("i.ytimg.com")
         self.thumbnail_timer = QTimer(self)
+        self.info_timer = QTimer(self)
+        self._inflight = None
         self.current_url = ""
         self.video_info = {}
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        self.thumbnail_requested = False
+        self.thumbnail_url = None
+        QtGui.QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+        
+        # One YoutubeDL serves every info lookup, so extractors, cookies and
+        # HTTP connections are set up once per session rather than per URL
+        self._ydl_info = yt_dlp.YoutubeDL(INFO_YDL_OPTS)
+        self._ydl_lock = threading.Lock()
+        
+        # Thumbnail decoding runs on a persistent worker thread
+        self.thumbnail_thread = QThread(self)
+        self.thumbnail_worker = ThumbnailWorker()
+        self.thumbnail_worker.moveToThread(self.thumbnail_thread)
+        
+        # Trimming the thumbnail cache touches many files; keep it off the GUI thread
+        QtCore.QThreadPool.globalInstance().start(_prune_thumbnail_cache)
+        
+        # Downloads and lookups run as jobs on thread pools, so worker threads
+        # are reused and a batch never has more than a few downloads running
+        self.download_pool = QtCore.QThreadPool(self)
+        self.download_pool.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
+        self.download_signals = DownloadSignals(self)
+        self.info_signals = InfoSignals(self)
         
         self.init_ui()
         self.setup_connections()
 
-    def get_app_stylesheet(self):
-        return """
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 11px;
-            }
-            QLineEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-color: #00ff88;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #00ff88;
-                color: #000000;
-            }
-            QPushButton:pressed {
-                background-color: #00cc6a;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #888888;
-            }
-            QComboBox {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 12px;
-            }
-            QComboBox:hover {
-                border-color: #00ff88;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-style: solid;
-                border-width: 3px;
-                border-color: #ffffff transparent transparent transparent;
-            }
-            QProgressBar {
-                border: 2px solid #404040;
-                border-radius: 8px;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                                  stop:0 #00ff88, stop:1 #00cc6a);
-                border-radius: 6px;
-            }
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                padding: 8px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 10px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-            }
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #404040;
-                border-radius: 4px;
-                background-color: #2d2d2d;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #00ff88;
-                border-color: #00ff88;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-        """
-
     def init_ui(self):
         main_layout = QVBoxLayout(self)
         
@@ -306,7 +713,7 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         
         url_input_layout = QHBoxLayout()
         self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText("Paste YouTube, Vimeo, or other video URL here...")
+        self.url_input.setPlaceholderText("Paste YouTube, Vimeo, or other video URLs here (separate several with spaces)...")
         url_input_layout.addWidget(self.url_input)
         
         self.fetch_info_btn = QPushButton("Fetch Info")
@@ -322,12 +729,7 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         
         # Thumbnail
         self.thumbnail_label.setAlignment(Qt.AlignCenter)
-        self.thumbnail_label.setStyleSheet("""
-            border: 2px solid #555;
-            border-radius: 8px;
-            background-color: #2c2c2c;
-            color: #888;
-        """)
+        self.thumbnail_label.setStyleSheet(THUMBNAIL_STYLESHEET)
         self.thumbnail_label.setFixedSize(300, 170)
         self.thumbnail_label.setText("No thumbnail loaded")
         info_layout.addWidget(self.thumbnail_label)
@@ -375,11 +777,45 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         self.format_combo.addItems(['Best Quality', '1080p', '720p', '480p', '360p'])
         format_layout.addWidget(self.format_combo)
         
+        # MKV takes any codec pair as a plain stream copy; MP4 plays everywhere
+        self.container_combo = QComboBox()
+        self.container_combo.addItem("MKV (fast)", 'mkv')
+        self.container_combo.addItem("MP4 (compatible)", 'mp4')
+        format_layout.addWidget(self.container_combo)
+        
         self.audio_only_checkbox = QCheckBox("Audio Only (MP3)")
         format_layout.addWidget(self.audio_only_checkbox)
         format_layout.addStretch()
         
         settings_layout.addLayout(format_layout)
+        
+        # Connection settings
+        network_layout = QHBoxLayout()
+        network_layout.addWidget(QLabel("Parallel Connections:"))
+        self.fragments_spinbox = QSpinBox()
+        self.fragments_spinbox.setRange(1, 16)
+        self.fragments_spinbox.setValue(DEFAULT_FRAGMENT_DOWNLOADS)
+        self.fragments_spinbox.setToolTip("HLS/DASH fragments downloaded at the same time, "
+                                          "or aria2c connections per file")
+        network_layout.addWidget(self.fragments_spinbox)
+        
+        # Retry policy
+        network_layout.addWidget(QLabel("Retries:"))
+        self.retries_spinbox = QSpinBox()
+        self.retries_spinbox.setRange(0, 50)
+        self.retries_spinbox.setValue(10)
+        network_layout.addWidget(self.retries_spinbox)
+        
+        network_layout.addWidget(QLabel("Retry Delay:"))
+        self.retry_delay_spinbox = QSpinBox()
+        self.retry_delay_spinbox.setRange(0, 30)
+        self.retry_delay_spinbox.setValue(1)
+        self.retry_delay_spinbox.setSuffix(" s")
+        self.retry_delay_spinbox.setToolTip("Initial wait before retrying; doubles on every attempt")
+        network_layout.addWidget(self.retry_delay_spinbox)
+        network_layout.addStretch()
+        
+        settings_layout.addLayout(network_layout)
         layout.addWidget(settings_group)
         
         # Progress Section
@@ -416,9 +852,12 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         log_group = QGroupBox("Download Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        # Plain text appends in constant time; the block limit bounds the
+        # memory a long session or retry storm can pile up
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.append("📋 Download log will appear here...")
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
+        self.log_text.appendPlainText("📋 Download log will appear here...")
         
         clear_log_btn = QPushButton("Clear Log")
         clear_log_btn.setFixedHeight(30)
@@ -433,27 +872,45 @@ class VideoDownloaderApp(QtWidgets.QWidget):
 
     def setup_connections(self):
         self.url_input.textChanged.connect(self.on_url_changed)
-        self.fetch_info_btn.clicked.connect(self.fetch_video_info)
+        self.fetch_info_btn.clicked.connect(self.refresh_video_info)
         self.path_button.clicked.connect(self.select_path)
         self.download_button.clicked.connect(self.start_download)
         self.cancel_button.clicked.connect(self.cancel_download)
         self.audio_only_checkbox.toggled.connect(self.on_audio_only_toggled)
         
-        # Timer for delayed info fetching
-        self.thumbnail_timer.timeout.connect(self.fetch_video_info)
+        # Timers for delayed thumbnail and info fetching
+        self.thumbnail_timer.timeout.connect(self.fetch_input_thumbnail)
         self.thumbnail_timer.setSingleShot(True)
+        self.info_timer.timeout.connect(self.fetch_video_info)
+        self.info_timer.setSingleShot(True)
+        
+        self.thumbnail_job.connect(self.thumbnail_worker.load)
+        self.thumbnail_worker.done.connect(self.show_thumbnail, Qt.QueuedConnection)
+        self.thumbnail_thread.start()
+        
+        self.info_signals.info.connect(self.on_info_received)
+        self.info_signals.error.connect(self.on_info_error)
+        self.download_signals.progress.connect(self.on_download_progress)
+        self.download_signals.status.connect(self.status_label.setText)
+        self.download_signals.finished.connect(self.on_download_finished)
+        self.download_signals.error.connect(self.on_download_error)
+        self.download_signals.log.connect(self.log_text.appendPlainText)
+        self.download_signals.done.connect(self.on_download_job_done)
 
     def on_url_changed(self, url):
         if url != self.current_url:
             self.current_url = url
             self.reset_video_info()
             if url.strip():
-                self.thumbnail_timer.start(1000)  # Delay 1 second
+                self.thumbnail_timer.start(150)  # Thumbnail shortcuts are one small GET
+                self.info_timer.start(1500)  # Delay 1.5 seconds
 
     def on_audio_only_toggled(self, checked):
         self.format_combo.setEnabled(not checked)
+        self.container_combo.setEnabled(not checked)
 
     def reset_video_info(self):
+        self.abort_inflight_request()
         self.thumbnail_label.clear()
         self.thumbnail_label.setText("No thumbnail loaded")
         self.title_label.setText("Title: Not loaded")
@@ -461,24 +918,69 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         self.uploader_label.setText("Uploader: Unknown")
         self.views_label.setText("Views: Unknown")
         self.video_info = {}
+        self.thumbnail_requested = False
+        self.thumbnail_url = None
+
+    def get_urls(self):
+        return self.url_input.text().split()
+
+    def cached_info(self, url):
+        entry = self._info_cache.get(url)
+        if entry is None:
+            return None
+        fetched, info = entry
+        if time.monotonic() - fetched > INFO_CACHE_TTL:
+            del self._info_cache[url]
+            return None
+        return info
+
+    def refresh_video_info(self):
+        # An explicit fetch always asks the site again
+        self.fetch_video_info(use_cache=False)
 
-    def fetch_video_info(self):
-        url = self.url_input.text().strip()
-        if not url:
+    def fetch_video_info(self, use_cache=True):
+        # With several URLs queued, preview the first one
+        urls = self.get_urls()
+        if not urls:
+            return
+        url = urls[0]
+        
+        # Re-pasting a URL we already looked up needs no new extraction
+        info = self.cached_info(url) if use_cache else None
+        if info is not None:
+            self.show_video_info(url, info)
             return
             
         self.status_label.setText("🔍 Fetching video information...")
         self.fetch_info_btn.setEnabled(False)
         
-        self.info_thread = VideoInfoThread(url)
-        self.info_thread.info_signal.connect(self.on_info_received)
-        self.info_thread.error_signal.connect(self.on_info_error)
-        self.info_thread.start()
+        # Show the thumbnail straight away where we can build its URL cheaply
+        if not self.thumbnail_requested:
+            self.fetch_thumbnail_preview(url)
+        
+        # Don't let rapid edits queue up one extraction per URL
+        if self.info_job is not None:
+            self.info_job.cancel()
+        
+        self.info_job = VideoInfoJob(self.info_signals, url, self._ydl_info, self._ydl_lock)
+        QtCore.QThreadPool.globalInstance().start(self.info_job)
 
-    def on_info_received(self, info):
-        self.video_info = info
+    def on_info_received(self, url, info):
+        # Drop the oldest lookup once the cache is full
+        self._info_cache.pop(url, None)
+        if len(self._info_cache) >= INFO_CACHE_SIZE:
+            del self._info_cache[next(iter(self._info_cache))]
+        self._info_cache[url] = (time.monotonic(), info)
+        self.show_video_info(url, info)
+
+    def show_video_info(self, url, info):
         self.fetch_info_btn.setEnabled(True)
         
+        # A lookup for a URL the user has since replaced only feeds the cache
+        if url not in self.get_urls()[:1]:
+            return
+        self.video_info = info
+        
         # Update video information
         title = info.get('title', 'Unknown Title')
         duration = info.get('duration', 0)
@@ -488,8 +990,8 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         self.title_label.setText(f"Title: {title}")
         
         if duration:
-            minutes, seconds = divmod(duration, 60)
-            hours, minutes = divmod(minutes, 60)
+            hours, rest = divmod(int(duration), 3600)
+            minutes, seconds = divmod(rest, 60)
             if hours:
                 duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
             else:
@@ -499,62 +1001,174 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         self.uploader_label.setText(f"Uploader: {uploader}")
         
         if view_count:
-            if view_count >= 1000000:
-                views_str = f"{view_count/1000000:.1f}M"
-            elif view_count >= 1000:
-                views_str = f"{view_count/1000:.1f}K"
-            else:
-                views_str = str(view_count)
+            unit, divisor = _VIEW_UNITS[min((len(str(view_count)) - 1) // 3, 3)]
+            views_str = f"{view_count / divisor:.1f}{unit}" if unit else str(view_count)
             self.views_label.setText(f"Views: {views_str}")
         
-        # Load thumbnail
-        thumbnail_url = info.get('thumbnail')
-        if thumbnail_url:
+        # Load thumbnail unless a shortcut already fetched it
+        thumbnail_url = _info_thumbnail(info)
+        if thumbnail_url and not self.thumbnail_requested:
             self.download_thumbnail(thumbnail_url)
         
         self.status_label.setText("✅ Video information loaded successfully!")
-        self.log_text.append(f"📹 Video: {title}")
-        self.log_text.append(f"👤 Uploader: {uploader}")
+        self.log_text.appendPlainText(f"📹 Video: {title}")
+        self.log_text.appendPlainText(f"👤 Uploader: {uploader}")
 
     def on_info_error(self, error):
         self.fetch_info_btn.setEnabled(True)
         self.status_label.setText(f"❌ Error fetching video info: {error}")
-        self.log_text.append(f"❌ Info fetch error: {error}")
+        self.log_text.appendPlainText(f"❌ Info fetch error: {error}")
+
+    def fetch_input_thumbnail(self):
+        urls = self.get_urls()
+        if urls and not self.thumbnail_requested:
+            self.fetch_thumbnail_preview(urls[0])
+
+    def abort_inflight_request(self):
+        # Only one thumbnail or oEmbed request matters at a time
+        if self._inflight is not None:
+            reply, self._inflight = self._inflight, None
+            reply.abort()
+
+    def fetch_thumbnail_preview(self, url):
+        match = _YT_ID_RE.search(url)
+        if match:
+            self.download_thumbnail(f"https://i.ytimg.com/vi/{match.group(1)}/hqdefault.jpg")
+            return
+        
+        endpoint = _oembed_endpoint(url)
+        if endpoint:
+            query = QtCore.QUrlQuery()
+            query.addQueryItem('url', url)
+            query.addQueryItem('format', 'json')
+            request_url = QtCore.QUrl(endpoint)
+            request_url.setQuery(query)
+            self.thumbnail_requested = True
+            self.abort_inflight_request()
+            reply = self.network_manager.get(_network_request(request_url))
+            reply.finished.connect(lambda: self.on_oembed_received(url, reply))
+            self._inflight = reply
+
+    def on_oembed_received(self, url, reply):
+        if self._inflight is reply:
+            self._inflight = None
+        if reply.error() == QNetworkReply.OperationCanceledError:
+            reply.deleteLater()
+            return
+        
+        thumbnail_url = None
+        if reply.error() == QNetworkReply.NoError:
+            try:
+                thumbnail_url = json.loads(bytes(reply.readAll())).get('thumbnail_url')
+            except (ValueError, AttributeError):
+                pass
+        reply.deleteLater()
+        
+        # Ignore replies for a URL the user has since replaced
+        if url not in self.get_urls()[:1]:
+            return
+        
+        if not thumbnail_url:
+            # Fall back to the thumbnail yt-dlp reports
+            self.thumbnail_requested = False
+            thumbnail_url = _info_thumbnail(self.video_info)
+        if thumbnail_url:
+            self.download_thumbnail(thumbnail_url)
 
     def download_thumbnail(self, url):
-        request = QNetworkRequest(QtCore.QUrl(url))
+        self.thumbnail_requested = True
+        self.thumbnail_url = url
+        
+        # Memory first, then the on-disk cache, and only then the network
+        pixmap = QtGui.QPixmapCache.find(url)
+        if pixmap is not None:
+            self.thumbnail_label.setPixmap(pixmap)
+            return
+        
+        cache_path = _thumbnail_cache_path(url)
+        if cache_path.is_file():
+            self.thumbnail_job.emit(url, QtCore.QByteArray())
+            return
+        
+        request = _network_request(QtCore.QUrl(url))
+        request.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferCache)
+        # Images are already compressed
+        request.setRawHeader(b'Accept-Encoding', b'identity')
+        self.abort_inflight_request()
         reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self.on_thumbnail_downloaded(reply))
+        reply.finished.connect(lambda: self.on_thumbnail_downloaded(url, reply))
+        self._inflight = reply
 
-    def on_thumbnail_downloaded(self, reply):
+    def on_thumbnail_downloaded(self, url, reply):
+        if self._inflight is reply:
+            self._inflight = None
         if reply.error() == QNetworkReply.NoError:
-            data = reply.readAll()
-            image = QtGui.QImage.fromData(data)
-            if not image.isNull():
-                scaled_image = image.scaled(300, 170, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                pixmap = QtGui.QPixmap.fromImage(scaled_image)
-                self.thumbnail_label.setPixmap(pixmap)
-            else:
-                self.thumbnail_label.setText("🚫 Invalid thumbnail")
-        else:
+            self.thumbnail_job.emit(url, reply.readAll())
+        elif reply.error() != QNetworkReply.OperationCanceledError and url == self.thumbnail_url:
             self.thumbnail_label.setText("🚫 Thumbnail load failed")
         
         reply.deleteLater()
 
+    def show_thumbnail(self, url, image):
+        # The user may have moved on to another video while this was decoding
+        is_current = url == self.thumbnail_url
+        if image.isNull():
+            if is_current:
+                self.thumbnail_label.setText("🚫 Invalid thumbnail")
+            return
+        
+        # Keep the decoder's pixel format; converting a preview this small buys nothing
+        pixmap = QtGui.QPixmap.fromImage(image, Qt.NoFormatConversion)
+        
+        # Qt evicts the least recently used pixmaps once the cache limit is hit
+        QtGui.QPixmapCache.insert(url, pixmap)
+        if is_current:
+            self.thumbnail_label.setPixmap(pixmap)
+
+    def closeEvent(self, event):
+        for job in self.download_jobs:
+            job.cancel()
+        # Queued lookups bail out once they get the lock
+        if self.info_job is not None:
+            self.info_job.cancel()
+        
+        # Waiting here would freeze the window until the network answers, so
+        # hide it and try closing again until the jobs have unwound and no
+        # lookup holds the shared YoutubeDL
+        if not self.download_pool.waitForDone(0) or not self._ydl_lock.acquire(blocking=False):
+            if self.close_timer is None:
+                self.close_timer = QTimer(self)
+                self.close_timer.timeout.connect(self.close)
+                self.close_timer.start(100)
+            self.hide()
+            event.ignore()
+            return
+        try:
+            self._ydl_info.close()
+        finally:
+            self._ydl_lock.release()
+        
+        if self.close_timer is not None:
+            self.close_timer.stop()
+        self.thumbnail_thread.quit()
+        self.thumbnail_thread.wait()
+        super().closeEvent(event)
+
     def select_path(self):
         path = QFileDialog.getExistingDirectory(self, "Select Download Directory", self.selected_path)
         if path:
             self.selected_path = path
             self.path_label.setText(path)
-            self.log_text.append(f"📁 Download path set to: {path}")
+            self.log_text.appendPlainText(f"📁 Download path set to: {path}")
 
     def start_download(self):
-        url = self.url_input.text().strip()
-        if not url:
+        urls = self.get_urls()
+        if not urls:
             QMessageBox.warning(self, "Warning", "Please enter a valid URL!")
             return
         
-        if not self.selected_path or not os.path.exists(self.selected_path):
+        # Checked once here so no job starts against a missing directory
+        if not self.selected_path or not os.path.isdir(self.selected_path):
             QMessageBox.warning(self, "Warning", "Please select a valid download directory!")
             return
         
@@ -566,41 +1180,100 @@ class VideoDownloaderApp(QtWidgets.QWidget):
         self.status_label.setText("🚀 Preparing download...")
         
         # Get settings
-        format_choice = self.format_combo.currentText()
-        audio_only = self.audio_only_checkbox.isChecked()
-        
-        # Start download thread
-        self.download_thread = DownloadThread(url, self.selected_path, format_choice, audio_only)
-        self.download_thread.progress_signal.connect(self.progress_bar.setValue)
-        self.download_thread.status_signal.connect(self.status_label.setText)
-        self.download_thread.finished_signal.connect(self.on_download_finished)
-        self.download_thread.error_signal.connect(self.on_download_error)
-        self.download_thread.log_signal.connect(self.log_text.append)
-        self.download_thread.start()
+        self.download_settings = {
+            'format_choice': self.format_combo.currentText(),
+            'audio_only': self.audio_only_checkbox.isChecked(),
+            'fragment_downloads': self.fragments_spinbox.value(),
+            'container': self.container_combo.currentData(),
+            'retries': self.retries_spinbox.value(),
+            'retry_delay': self.retry_delay_spinbox.value(),
+            'ffmpeg_path': self.ffmpeg_path,
+            'aria2_path': self.aria2_path,
+        }
+        
+        # The pool queues the batch and runs at most MAX_CONCURRENT_DOWNLOADS
+        # jobs at once
+        self.download_total = len(urls)
+        self.download_jobs = []
+        self.download_progress = {}
+        self.downloaded_files = {}
+        self.download_errors = []
+        self.download_cancelled = False
+        self.active_downloads = len(urls)
+        
+        if len(urls) > 1:
+            self.log_text.appendPlainText(f"📦 Starting {len(urls)} downloads")
+        for url in urls:
+            self.queue_download(url)
+
+    def queue_download(self, url):
+        # yt-dlp mutates the info dict while processing, so pass a copy.
+        # Playlists keep lazy entries that cannot be copied, and a live
+        # stream's manifests move on after the lookup; both are extracted
+        # again by the download, as is anything that listed no formats.
+        info = self.cached_info(url)
+        if (info is not None and info.get('_type', 'video') == 'video'
+                and info.get('formats') and not info.get('is_live')):
+            info = copy.deepcopy(info)
+        else:
+            info = None
+        
+        job = DownloadJob(self.download_signals, url, self.selected_path, info=info,
+                          **self.download_settings)
+        self.download_jobs.append(job)
+        self.download_progress[job] = 0
+        self.download_pool.start(job)
 
     def cancel_download(self):
-        if self.download_thread and self.download_thread.isRunning():
-            self.download_thread.cancel()
+        if self.active_downloads:
+            self.download_cancelled = True
+            # Running jobs unwind and queued ones return as soon as they
+            # start, so every job still reports done
+            for job in self.download_jobs:
+                job.cancel()
             self.status_label.setText("❌ Download cancelled")
-            self.log_text.append("❌ Download cancelled by user")
+            self.log_text.appendPlainText("❌ Download cancelled by user")
         
         self.reset_download_ui()
 
-    def on_download_finished(self, output_path):
+    def on_download_progress(self, job, percent):
+        # Jobs from a cancelled batch may still report while they unwind
+        if job not in self.download_progress:
+            return
+        # The bar shows the average over every download in the batch
+        self.download_progress[job] = percent
+        self.progress_bar.setValue(sum(self.download_progress.values()) // self.download_total)
+
+    def on_download_finished(self, job, output_path):
+        if job not in self.download_progress:
+            return
+        self.downloaded_files[job] = output_path
         self.status_label.setText(f"✅ Download completed! File saved to: {os.path.basename(output_path)}")
-        self.log_text.append(f"✅ Download completed successfully!")
-        self.log_text.append(f"📁 File location: {output_path}")
-        
-        # Show completion message
-        QMessageBox.information(self, "Download Complete", 
-                              f"Video downloaded successfully!\n\nLocation: {output_path}")
-        
-        self.reset_download_ui()
+        self.log_text.appendPlainText("✅ Download completed successfully!")
+        self.log_text.appendPlainText(f"📁 File location: {output_path}")
 
-    def on_download_error(self, error):
+    def on_download_error(self, job, error):
+        if job not in self.download_progress:
+            return
+        self.download_errors.append(error)
         self.status_label.setText(f"❌ Download failed: {error}")
-        QMessageBox.critical(self, "Download Error", f"Download failed:\n\n{error}")
+
+    def on_download_job_done(self, job):
+        if job not in self.download_progress:
+            return
+        self.active_downloads -= 1
+        if self.download_cancelled or self.active_downloads:
+            return
+        
         self.reset_download_ui()
+        if self.download_errors:
+            errors = "\n\n".join(self.download_errors)
+            QMessageBox.critical(self, "Download Error", f"Download failed:\n\n{errors}")
+        elif self.downloaded_files:
+            # Show completion message
+            locations = "\n".join(self.downloaded_files.values())
+            QMessageBox.information(self, "Download Complete", 
+                                  f"Video downloaded successfully!\n\nLocation: {locations}")
 
     def reset_download_ui(self):
         self.download_button.setVisible(True)